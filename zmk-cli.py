@@ -5,20 +5,17 @@ ZMK Keyboard Manager - Interactive CLI for Offsetkey keyboard
 
 from __future__ import annotations
 
+import functools
 import os
 import re
-import shutil
 import subprocess
 import sys
 from pathlib import Path
 
-# Check dependencies
+# Check dependencies; the other rich submodules are imported lazily by the
+# functions that need them, so the menu paints sooner on cold start
 try:
     from rich.console import Console
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.prompt import Prompt, Confirm
-    from rich import box
 except ImportError:
     print("Missing 'rich' library. Install with: pipx install rich")
     sys.exit(1)
@@ -34,26 +31,50 @@ SVG_OUTPUT = REPO_DIR / "keymap-drawer" / "offsetkey.svg"
 YAML_OUTPUT = REPO_DIR / "keymap-drawer" / "offsetkey.yaml"
 ZMK_REFERENCE = REPO_DIR / "docs" / "zmk-reference.md"
 
+# Matches every CONFIG_*=value line; one findall replaces per-setting searches.
+# Bytes pattern: the .conf is ASCII, so parsing raw bytes skips the UTF-8 decode
+_CONF_LINE_RE = re.compile(rb'^(CONFIG_\w+)=(\S+)', re.MULTILINE)
+
 console = Console()
 
+# File-content cache keyed by path, invalidated by file mtime
+_FILE_CACHE: dict[Path, tuple[int, bytes]] = {}
 
-def header() -> None:
-    """Display the header."""
-    console.clear()
-    console.print()
-    console.print(
-        Panel.fit(
-            "[bold cyan]⌨  ZMK Keyboard Manager[/bold cyan]\n"
-            "[dim]Offsetkey • Eyelash Nano • Split[/dim]",
-            border_style="cyan",
-            padding=(0, 2),
-        )
+
+def _read_cached(path: Path) -> bytes:
+    """Read a file as raw bytes, reusing the cached data while its mtime is unchanged.
+
+    Bytes rather than str: the parsers work on ASCII patterns, so skipping
+    the UTF-8 decode avoids a full pass over the file. Decode only the
+    small pieces that end up in the UI.
+    """
+    mtime = path.stat().st_mtime_ns
+    cached = _FILE_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    data = path.read_bytes()
+    _FILE_CACHE[path] = (mtime, data)
+    return data
+
+
+def header():
+    """Build the header panel."""
+    from rich.panel import Panel
+
+    return Panel.fit(
+        "[bold cyan]⌨  ZMK Keyboard Manager[/bold cyan]\n"
+        "[dim]Offsetkey • Eyelash Nano • Split[/dim]",
+        border_style="cyan",
+        padding=(0, 2),
     )
-    console.print()
 
 
 def show_menu() -> None:
-    """Display the main menu."""
+    """Clear the screen and render the header and menu in one pass."""
+    from rich import box
+    from rich.console import Group
+    from rich.table import Table
+
     table = Table(
         show_header=False,
         box=box.ROUNDED,
@@ -84,76 +105,129 @@ def show_menu() -> None:
         else:
             table.add_row(f"\\[{key}]", action)
 
-    console.print(table)
-    console.print()
+    # One render pass (and one terminal write) for header + menu.
+    # Only clear a real terminal; dumb terminals (and pipes) just get the
+    # next screen appended instead of a full-screen erase + repaint
+    if console.is_terminal and os.environ.get("TERM") != "dumb":
+        console.clear()
+    console.print(Group("", header(), "", table, ""))
+
+
+# Lazily imported keymap_drawer machinery, loaded once per session
+_drawer_cache: tuple | None = None
+
+
+def _load_drawer() -> tuple:
+    """Import keymap_drawer and load the drawer config once; reuse afterwards."""
+    global _drawer_cache
+    if _drawer_cache is None:
+        import yaml
+        from keymap_drawer.config import Config
+        from keymap_drawer.draw import KeymapDrawer
+        from keymap_drawer.parse import ZmkKeymapParser
+
+        config = Config.parse_obj(yaml.safe_load(DRAWER_CONFIG.read_text()))
+        _drawer_cache = (config, ZmkKeymapParser, KeymapDrawer)
+    return _drawer_cache
+
+
+# Parsed keymap (keymap_drawer's YAML-shaped dict), reused across menu actions
+_parsed_keymap: dict | None = None
+_parsed_mtime = 0
+
+# Cached existence checks for constant paths; the layout file never changes
+# during a session, and the SVG flag is refreshed when regenerate_svg writes it
+_physical_layout_exists: bool | None = None
+_svg_output_exists: bool | None = None
+
+
+def _have_physical_layout() -> bool:
+    global _physical_layout_exists
+    if _physical_layout_exists is None:
+        _physical_layout_exists = PHYSICAL_LAYOUT.exists()
+    return _physical_layout_exists
+
+
+def _have_svg_output() -> bool:
+    global _svg_output_exists
+    if _svg_output_exists is None:
+        _svg_output_exists = SVG_OUTPUT.exists()
+    return _svg_output_exists
+
+
+def _get_parsed() -> dict:
+    """Parse the keymap via keymap_drawer, reusing the result while its mtime is unchanged."""
+    global _parsed_keymap, _parsed_mtime
+    mtime = KEYMAP_FILE.stat().st_mtime_ns
+    if _parsed_keymap is None or mtime != _parsed_mtime:
+        config, ZmkKeymapParser, _ = _load_drawer()
+        # Fresh parser each time; parse() is single-use
+        with KEYMAP_FILE.open() as keymap_in:
+            _parsed_keymap = ZmkKeymapParser(config.parse_config, None).parse(keymap_in)
+        _parsed_mtime = mtime
+    return _parsed_keymap
 
 
 def regenerate_svg() -> None:
-    """Regenerate the keymap SVG diagram using two-step process: parse then draw."""
+    """Regenerate the keymap SVG diagram in-process: parse the keymap, then draw."""
     console.print("[cyan]→[/cyan] Regenerating keymap diagram...")
 
     try:
-        # Step 1: Parse ZMK keymap to YAML
-        # Note: -c/--config goes BEFORE the subcommand (it's a global option)
-        console.print("[dim]  Parsing keymap...[/dim]")
-        parse_result = subprocess.run(
-            [
-                "keymap",
-                "-c", str(DRAWER_CONFIG),
-                "parse",
-                "-z", str(KEYMAP_FILE),
-            ],
-            capture_output=True,
-            text=True,
-            cwd=REPO_DIR,
-        )
+        config, _, KeymapDrawer = _load_drawer()
+    except ImportError:
+        console.print("[red]✗[/red] 'keymap_drawer' package not found. Install with: [dim]pip install keymap-drawer[/dim]")
+        return
+
+    import io
 
-        if parse_result.returncode != 0:
-            console.print(f"[red]✗[/red] Parse error: {parse_result.stderr}")
-            return
+    import yaml
 
-        # Save intermediate YAML
+    try:
+        # Step 1: Parse ZMK keymap (cached across menu actions)
+        console.print("[dim]  Parsing keymap...[/dim]")
+        parsed = _get_parsed()
+
+        # Save intermediate YAML for debugging
         YAML_OUTPUT.parent.mkdir(exist_ok=True)
-        YAML_OUTPUT.write_text(parse_result.stdout)
+        with YAML_OUTPUT.open("w") as yaml_out:
+            yaml.safe_dump(parsed, yaml_out, width=160, sort_keys=False, default_flow_style=None, allow_unicode=True)
 
-        # Step 2: Draw SVG from YAML
-        # Use -d to specify the DTS physical layout file for custom keyboards
+        # Step 2: Draw SVG, preferring the DTS physical layout for this custom board
         console.print("[dim]  Drawing SVG...[/dim]")
-        draw_cmd = [
-            "keymap",
-            "-c", str(DRAWER_CONFIG),
-            "draw",
-        ]
-        # Add physical layout if available
-        if PHYSICAL_LAYOUT.exists():
-            draw_cmd.extend(["-d", str(PHYSICAL_LAYOUT)])
-        draw_cmd.append(str(YAML_OUTPUT))
-
-        draw_result = subprocess.run(
-            draw_cmd,
-            capture_output=True,
-            text=True,
-            cwd=REPO_DIR,
+        if _have_physical_layout():
+            layout = {"dts_layout": str(PHYSICAL_LAYOUT)}
+        else:
+            layout = parsed.get("layout", {})
+
+        svg_out = io.StringIO()
+        drawer = KeymapDrawer(
+            config=config,
+            out=svg_out,
+            layers=parsed["layers"],
+            layout=layout,
+            combos=parsed.get("combos", []),
         )
+        drawer.print_board()
 
-        if draw_result.returncode == 0:
-            SVG_OUTPUT.write_text(draw_result.stdout)
-            console.print(f"[green]✓[/green] Saved to [dim]{SVG_OUTPUT.relative_to(REPO_DIR)}[/dim]")
-        else:
-            console.print(f"[red]✗[/red] Draw error: {draw_result.stderr}")
-    except FileNotFoundError:
-        console.print("[red]✗[/red] 'keymap' command not found. Install with: [dim]pipx install keymap-drawer[/dim]")
+        SVG_OUTPUT.write_text(svg_out.getvalue())
+        global _svg_output_exists
+        _svg_output_exists = True
+        console.print(f"[green]✓[/green] Saved to [dim]{SVG_OUTPUT.relative_to(REPO_DIR)}[/dim]")
+    except Exception as exc:
+        console.print(f"[red]✗[/red] keymap-drawer error: {exc}")
 
 
 def open_svg() -> None:
     """Open the SVG in the default viewer."""
-    if not SVG_OUTPUT.exists():
+    if not _have_svg_output():
         console.print("[yellow]⚠[/yellow] SVG not found. Regenerating first...")
         regenerate_svg()
 
-    if SVG_OUTPUT.exists():
+    if _have_svg_output():
+        import webbrowser
+
         console.print(f"[cyan]→[/cyan] Opening [dim]{SVG_OUTPUT.name}[/dim]...")
-        subprocess.run(["xdg-open", str(SVG_OUTPUT)], stderr=subprocess.DEVNULL)
+        webbrowser.open(SVG_OUTPUT.as_uri())
         console.print("[green]✓[/green] Opened in browser")
 
 
@@ -170,12 +244,30 @@ EDITORS: dict[str, tuple[list[str] | None, str | None, bool]] = {
 }
 
 
+@functools.lru_cache(maxsize=1)
+def _path_executables() -> frozenset[str]:
+    """Names of everything on PATH, listed once per session.
+
+    One readdir per PATH entry beats per-candidate shutil.which probes,
+    which stat every directory for every candidate.
+    """
+    names: set[str] = set()
+    for directory in os.environ.get("PATH", "").split(os.pathsep):
+        try:
+            names.update(os.listdir(directory or "."))
+        except OSError:
+            pass
+    return frozenset(names)
+
+
+@functools.lru_cache(maxsize=1)
 def get_editor() -> str:
-    """Get the user's preferred editor."""
+    """Get the user's preferred editor (resolved once per session)."""
     if editor := os.environ.get("EDITOR"):
         return editor
+    available = _path_executables()
     for ed in ("zed", "code", "nvim", "vim", "nano"):
-        if shutil.which(ed):
+        if ed in available:
             return ed
     return "nano"
 
@@ -208,84 +300,33 @@ def edit_file(filepath: Path, description: str, *, with_reference: bool = False)
     console.print("[green]✓[/green] Editor closed")
 
 
-def parse_layers() -> list[dict]:
-    """Parse layer definitions from keymap file.
-
-    ZMK keymap structure:
-        keymap {
-            compatible = "zmk,keymap";
-
-            layer_name {
-                bindings = <...>;
-                label = "LABEL";  // optional
-            };
-        };
-    """
-    content = KEYMAP_FILE.read_text()
-    layers = []
-
-    # Parse #define macros for layer indices (e.g., #define BASE 0)
-    layer_defines = {}
-    for match in re.finditer(r'#define\s+(\w+)\s+(\d+)', content):
-        layer_defines[match.group(1)] = int(match.group(2))
-
-    # Find the keymap block
-    keymap_match = re.search(r'keymap\s*\{[^}]*compatible\s*=\s*"zmk,keymap"\s*;(.+)', content, re.DOTALL)
-    if not keymap_match:
-        return layers
-
-    keymap_content = keymap_match.group(1)
-
-    # Find layer blocks - match layer_name { ... }; pattern
-    # Use a more robust approach: find each layer block by matching balanced braces
-    layer_pattern = r'(\w+)\s*\{((?:[^{}]|\{[^{}]*\})*)\}'
-    matches = re.finditer(layer_pattern, keymap_content, re.DOTALL)
-
-    for match in matches:
-        node_name = match.group(1)
-        layer_content = match.group(2)
-
-        # Skip non-layer blocks (like behaviors, combos)
-        if 'bindings' not in layer_content:
-            continue
-
-        # Extract bindings
-        bindings_match = re.search(r'bindings\s*=\s*<([^>]+)>', layer_content, re.DOTALL)
-        if not bindings_match:
-            continue
-
-        bindings = bindings_match.group(1)
-
-        # Extract optional label
-        label_match = re.search(r'label\s*=\s*"([^"]+)"', layer_content)
-        label = label_match.group(1) if label_match else None
-
-        # Count key bindings by counting '&' prefixed behaviors
-        keys = re.findall(r'&\w+', bindings)
-        key_count = len(keys)
-
-        # Determine display name and index
-        display_name = label if label else node_name
-        layer_idx = layer_defines.get(display_name, layer_defines.get(node_name, len(layers)))
-
-        layers.append({
-            'name': display_name,
-            'node': node_name,
-            'index': layer_idx,
-            'key_count': key_count,
-        })
-
-    # Sort by index
-    layers.sort(key=lambda x: x['index'])
-    return layers
+def _key_text(key) -> str:
+    """Flatten a keymap-drawer key spec (str, dict or null) to its tap legend."""
+    if key is None:
+        return ""
+    if isinstance(key, dict):
+        return str(key.get('t', ''))
+    return str(key)
 
 
 def show_layers() -> None:
-    """Display a summary of layers parsed from keymap file."""
+    """Display a summary of layers and combos from the parsed keymap."""
+    from rich import box
+    from rich.console import Group
+    from rich.table import Table
+
     console.print("[cyan]→[/cyan] Parsing keymap...")
 
-    layers = parse_layers()
+    try:
+        parsed = _get_parsed()
+    except ImportError:
+        console.print("[red]✗[/red] 'keymap_drawer' package not found. Install with: [dim]pip install keymap-drawer[/dim]")
+        return
+    except Exception as exc:
+        console.print(f"[red]✗[/red] keymap-drawer error: {exc}")
+        return
 
+    layers = parsed.get('layers', {})
     if not layers:
         console.print("[yellow]⚠[/yellow] No layers found in keymap")
         return
@@ -297,75 +338,52 @@ def show_layers() -> None:
     )
     table.add_column("Index", style="yellow", justify="center", width=5)
     table.add_column("Name", style="bold cyan")
-    table.add_column("Node", style="dim")
     table.add_column("Keys", style="white", justify="right")
 
-    for layer in layers:
-        table.add_row(
-            str(layer['index']),
-            layer['name'],
-            layer['node'] if layer['node'] != layer['name'] else "",
-            str(layer['key_count']),
-        )
+    for index, (name, keys) in enumerate(layers.items()):
+        table.add_row(str(index), name, str(len(keys)))
 
-    console.print(table)
-    console.print()
+    renderables = [table]
 
-    # Parse and show combos
-    content = KEYMAP_FILE.read_text()
-    combos = parse_combos(content)
+    # Show combos (position lists refer to key indices in the layout)
+    combos = parsed.get('combos', [])
     if combos:
         combo_table = Table(
             title="Combos",
             box=box.ROUNDED,
             border_style="yellow",
         )
-        combo_table.add_column("Name", style="yellow")
         combo_table.add_column("Keys", style="white")
         combo_table.add_column("Action", style="cyan")
+        combo_table.add_column("Layers", style="dim")
 
         for combo in combos:
-            combo_table.add_row(combo['name'], combo['keys'], combo['action'])
-
-        console.print(combo_table)
-
+            positions = " ".join(str(p) for p in combo.get('p', []))
+            action = _key_text(combo.get('k'))
+            combo_layers = " ".join(combo.get('l', []))
+            combo_table.add_row(positions, action, combo_layers)
 
-def parse_combos(content: str) -> list:
-    """Parse combo definitions from keymap content."""
-    combos = []
+        renderables += ["", combo_table]
 
-    # Find combos block
-    combos_match = re.search(r'combos\s*\{[^}]*compatible\s*=\s*"zmk,combos"\s*;(.+?)\n\s*\};', content, re.DOTALL)
-    if not combos_match:
-        return combos
-
-    combos_content = combos_match.group(1)
-
-    # Find individual combo definitions
-    combo_pattern = r'(\w+)\s*\{[^{}]*bindings\s*=\s*<([^>]+)>[^{}]*key-positions\s*=\s*<([^>]+)>[^{}]*\}'
-    for match in re.finditer(combo_pattern, combos_content, re.DOTALL):
-        name = match.group(1)
-        action = match.group(2).strip()
-        keys = match.group(3).strip()
-
-        combos.append({
-            'name': name,
-            'action': action,
-            'keys': keys,
-        })
-
-    return combos
+    # Both tables in one render pass
+    console.print(Group(*renderables))
 
 
 def show_settings() -> None:
     """Display current keyboard settings from .conf file."""
+    from rich import box
+    from rich.table import Table
+
     console.print("[cyan]→[/cyan] Reading config...")
 
-    content = CONF_FILE.read_text()
+    content = _read_cached(CONF_FILE)
 
-    def get_setting(pattern, default="?"):
-        match = re.search(pattern, content)
-        return match.group(1) if match else default
+    # One pass over the raw bytes builds a key -> value dict for all settings
+    settings = dict(_CONF_LINE_RE.findall(content))
+
+    def get_setting(key: bytes, default: str = "?") -> str:
+        value = settings.get(key)
+        return value.decode('utf-8', 'replace') if value is not None else default
 
     table = Table(
         title="Keyboard Settings",
@@ -377,38 +395,80 @@ def show_settings() -> None:
     table.add_column("Notes", style="dim")
 
     # Parse and display settings
-    sleep_timeout = int(get_setting(r'CONFIG_ZMK_IDLE_SLEEP_TIMEOUT=(\d+)', '3600000'))
-    idle_timeout = int(get_setting(r'CONFIG_ZMK_IDLE_TIMEOUT=(\d+)', '15000'))
+    sleep_timeout = int(get_setting(b'CONFIG_ZMK_IDLE_SLEEP_TIMEOUT', '3600000'))
+    idle_timeout = int(get_setting(b'CONFIG_ZMK_IDLE_TIMEOUT', '15000'))
 
     table.add_row("Sleep timeout", f"{sleep_timeout // 60000} min", "Deep sleep")
     table.add_row("Idle timeout", f"{idle_timeout // 1000} sec", "Screen off")
-    table.add_row("Display", get_setting(r'CONFIG_ZMK_DISPLAY=(\w)', 'n'), "OLED enabled")
-    table.add_row("RGB Underglow", get_setting(r'CONFIG_ZMK_RGB_UNDERGLOW=(\w)', 'n'), "LED strip")
-    table.add_row("RGB on start", get_setting(r'CONFIG_ZMK_RGB_UNDERGLOW_ON_START=(\w)', 'n'), "")
-    table.add_row("Pointing device", get_setting(r'CONFIG_ZMK_POINTING=(\w)', 'n'), "Trackpoint")
-    table.add_row("Debounce (press)", f"{get_setting(r'CONFIG_ZMK_KSCAN_DEBOUNCE_PRESS_MS=(\d+)', '5')} ms", "")
-    table.add_row("Debounce (release)", f"{get_setting(r'CONFIG_ZMK_KSCAN_DEBOUNCE_RELEASE_MS=(\d+)', '5')} ms", "")
-    table.add_row("BT TX Power", "+8 dBm" if "TX_PWR_PLUS_8=y" in content else "default", "Range")
+    table.add_row("Display", get_setting(b'CONFIG_ZMK_DISPLAY', 'n'), "OLED enabled")
+    table.add_row("RGB Underglow", get_setting(b'CONFIG_ZMK_RGB_UNDERGLOW', 'n'), "LED strip")
+    table.add_row("RGB on start", get_setting(b'CONFIG_ZMK_RGB_UNDERGLOW_ON_START', 'n'), "")
+    table.add_row("Pointing device", get_setting(b'CONFIG_ZMK_POINTING', 'n'), "Trackpoint")
+    table.add_row("Debounce (press)", f"{get_setting(b'CONFIG_ZMK_KSCAN_DEBOUNCE_PRESS_MS', '5')} ms", "")
+    table.add_row("Debounce (release)", f"{get_setting(b'CONFIG_ZMK_KSCAN_DEBOUNCE_RELEASE_MS', '5')} ms", "")
+    table.add_row("BT TX Power", "+8 dBm" if settings.get(b'CONFIG_BT_CTLR_TX_PWR_PLUS_8') == b"y" else "default", "Range")
 
     console.print(table)
 
 
+def _iter_nul_records(stream):
+    """Yield NUL-terminated records from a stream without buffering it whole."""
+    buf = ""
+    while chunk := stream.read(8192):
+        buf += chunk
+        records = buf.split('\0')
+        buf = records.pop()  # last piece may be incomplete
+        yield from records
+    if buf:
+        yield buf
+
+
+def _iter_status_entries(records):
+    """Yield (XY status, path) pairs from `git status --porcelain=v2 -z` records.
+
+    NUL-terminated records handle filenames with spaces/newlines; renames
+    carry the original path as a separate NUL-terminated token.
+    """
+    records = iter(records)
+    for record in records:
+        if not record:
+            continue
+        kind, _, rest = record.partition(' ')
+        if kind == '1':  # ordinary change: XY sub mH mI mW hH hI path
+            fields = rest.split(' ', 7)
+            yield fields[0], fields[7]
+        elif kind == '2':  # rename/copy: same + Xscore path, then orig path
+            fields = rest.split(' ', 8)
+            orig = next(records, '')
+            yield fields[0], f"{orig} → {fields[8]}"
+        elif kind == 'u':  # unmerged: XY sub m1 m2 m3 mW h1 h2 h3 path
+            fields = rest.split(' ', 9)
+            yield fields[0], fields[9]
+        elif kind in ('?', '!'):  # untracked / ignored
+            yield kind * 2, rest
+
+
 def git_commit_push() -> None:
     """Commit and push changes to GitHub."""
-    result = subprocess.run(
-        ["git", "status", "--porcelain"],
-        capture_output=True, text=True, cwd=REPO_DIR,
-    )
-
-    if not result.stdout.strip():
+    from rich.prompt import Confirm, Prompt
+
+    # Stream the status so entries print as git emits them, without
+    # buffering the whole working-tree listing in memory
+    n_changes = 0
+    with subprocess.Popen(
+        ["git", "status", "--porcelain=v2", "-z"],
+        stdout=subprocess.PIPE, text=True, cwd=REPO_DIR,
+    ) as proc:
+        for status, filepath in _iter_status_entries(_iter_nul_records(proc.stdout)):
+            if n_changes == 0:
+                console.print("[cyan]→[/cyan] Changed files:")
+            n_changes += 1
+            color = "green" if "A" in status else "yellow" if "M" in status else "red"
+            console.print(f"  [{color}]{status}[/{color}] {filepath}")
+
+    if n_changes == 0:
         console.print("[yellow]⚠[/yellow] No changes to commit")
         return
-
-    console.print("[cyan]→[/cyan] Changed files:")
-    for line in result.stdout.strip().split('\n'):
-        status, filepath = line[:2], line[3:]
-        color = "green" if "A" in status else "yellow" if "M" in status else "red"
-        console.print(f"  [{color}]{status}[/{color}] {filepath}")
     console.print()
 
     if not Confirm.ask("Commit and push these changes?"):
@@ -417,18 +477,19 @@ def git_commit_push() -> None:
 
     msg = Prompt.ask("Commit message", default="Update keymap")
 
-    console.print("[cyan]→[/cyan] Committing...")
-    subprocess.run(["git", "add", "-A"], check=True, cwd=REPO_DIR)
-    subprocess.run(["git", "commit", "-m", msg], check=True, cwd=REPO_DIR)
-
-    console.print("[cyan]→[/cyan] Pushing to GitHub...")
-    result = subprocess.run(["git", "push"], capture_output=True, text=True, cwd=REPO_DIR)
+    console.print("[cyan]→[/cyan] Committing and pushing...")
+    # One shell chain instead of three sequential git processes; the message
+    # is passed as a positional arg so no quoting/escaping is needed
+    result = subprocess.run(
+        ["sh", "-c", 'git add -A && git commit -m "$1" && git push', "sh", msg],
+        capture_output=True, text=True, cwd=REPO_DIR,
+    )
 
     if result.returncode == 0:
         console.print("[green]✓[/green] Pushed! GitHub Actions will build firmware.")
         console.print("[dim]  Download from: Actions → latest run → firmware artifact[/dim]")
     else:
-        console.print(f"[red]✗[/red] Push failed: {result.stderr}")
+        console.print(f"[red]✗[/red] Commit/push failed: {result.stderr or result.stdout}")
 
 
 def open_github_actions() -> None:
@@ -443,23 +504,25 @@ def open_github_actions() -> None:
 
     remote = result.stdout.strip()
 
-    # Convert to HTTPS URL
-    if remote.startswith("git@"):
-        # git@github.com:user/repo.git -> https://github.com/user/repo
-        remote = remote.replace("git@github.com:", "https://github.com/").replace(".git", "")
-    elif remote.endswith(".git"):
-        remote = remote[:-4]
+    # Convert to HTTPS URL: git@github.com:user/repo.git -> https://github.com/user/repo
+    remote = remote.removeprefix("git@github.com:")
+    if not remote.startswith("http"):
+        remote = "https://github.com/" + remote
+    remote = remote.removesuffix(".git")
+
+    import webbrowser
 
     actions_url = f"{remote}/actions"
     console.print(f"[cyan]→[/cyan] Opening [dim]{actions_url}[/dim]")
-    subprocess.run(["xdg-open", actions_url], stderr=subprocess.DEVNULL)
+    webbrowser.open(actions_url)
     console.print("[green]✓[/green] Opened in browser")
 
 
 def main() -> None:
     """Main loop."""
+    from rich.prompt import Prompt
+
     while True:
-        header()
         show_menu()
 
         choice = Prompt.ask(